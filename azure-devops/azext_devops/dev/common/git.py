@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import os
 import subprocess
 import sys
 
@@ -94,8 +95,20 @@ def get_git_credentials(organization):
 
 
 def get_git_remotes():
-    if _git_remotes:
-        return _git_remotes
+    # Cache per working directory, including the case where no remotes could be read, so that detection
+    # runs 'git remote -v' at most once per directory in a process.
+    try:
+        cwd = os.getcwd()
+    except OSError as ex:
+        # The working directory no longer exists, so there is nothing to key the cache on.
+        logger.debug(ex, exc_info=True)
+        return _get_git_remotes()
+    if cwd not in _git_remotes:
+        _git_remotes[cwd] = _get_git_remotes()
+    return _git_remotes[cwd]
+
+
+def _get_git_remotes():
     try:
         # Example output:
         # git remote - v
@@ -112,11 +125,12 @@ def get_git_remotes():
         lines = output.decode(sys.stdout.encoding).split('\n')
     else:
         lines = output.decode().split('\n')
+    remotes = {}
     for line in lines:
         components = line.strip().split()
         if len(components) == 3:
-            _git_remotes[components[0] + components[2]] = components[1]
-    return _git_remotes
+            remotes[components[0] + components[2]] = components[1]
+    return remotes
 
 
 def resolve_git_refs(ref):
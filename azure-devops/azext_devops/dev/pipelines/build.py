@@ -3,8 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
-from webbrowser import open_new
-
 from knack.log import get_logger
 from azext_devops.devops_sdk.v5_0.build.models import Build, DefinitionReference, AgentPoolQueue
 from azext_devops.dev.common.git import resolve_git_ref_heads
@@ -196,9 +194,9 @@ def _open_build(build, organization):
     :param :class:`<Build> <v5_0.build.models.Build>` build:
     :param str organization:
     """
+    from webbrowser import open_new
     # https://dev.azure.com/OrgName/ProjectName/_build/index?buildId=1234
     project = build.project.name
-    url = organization.rstrip('/') + '/' + uri_quote(project) + '/_build/index?buildid='\
-        + uri_quote(str(build.id))
+    url = '{}/{}/_build/index?buildid={}'.format(organization.rstrip('/'), uri_quote(project), build.id)
     logger.debug('Opening web page: %s', url)
     open_new(url=url)
@@ -3,9 +3,10 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
-from webbrowser import open_new
+import time
 
 from knack.log import get_logger
+from azext_devops.devops_sdk.exceptions import AzureDevOpsClientRequestError, AzureDevOpsServiceError
 from azext_devops.dev.common.services import (get_build_client, get_git_client,
                                               resolve_instance_and_project,
                                               resolve_instance_project_and_repo)
@@ -20,7 +21,7 @@ def build_definition_list(name=None, top=None, organization=None, project=None,
     """List build definitions.
     :param name: Limit results to definitions with this name or starting with this name. Examples: "FabCI" or "Fab*"
     :type name: bool
-    :param top: Maximum number of definitions to list.
+    :param top: Maximum number of definitions to list. Defaults to 100.
     :type top: int
     :param repository: Limit results to definitions associated with this repository.
     :type repository: str
@@ -32,6 +33,10 @@ def build_definition_list(name=None, top=None, organization=None, project=None,
     organization, project, repository = resolve_instance_project_and_repo(
         detect=detect, organization=organization, project=project, repo=repository)
     client = get_build_client(organization)
+    default_top_applied = top is None
+    if default_top_applied:
+        top = _DEFAULT_DEFINITION_LIST_TOP
+        logger.debug('No --top supplied, listing at most %s definitions.', top)
     query_order = 'DefinitionNameAscending'
     repository_type = None
     if repository is not None:
@@ -49,6 +54,8 @@ def build_definition_list(name=None, top=None, organization=None, project=None,
     definition_references = client.get_definitions(project=project, name=name, repository_id=resolved_repository,
                                                    repository_type=repository_type, top=top,
                                                    query_order=query_order)
+    if default_top_applied and len(definition_references) == top:
+        logger.warning('Results were limited to the first %s definitions. Use --top to list more.', top)
     return definition_references
 
 
@@ -82,10 +89,10 @@ def _open_definition(definition, organization):
     :param :class:`<BuildDefinitionReference> <v5_0.build.models.BuildDefinitionReference>` definition:
     :param str organization:
     """
+    from webbrowser import open_new
     # https://dev.azure.com/OrgName/ProjectName/_build/index?definitionId=1234
     project = definition.project.name
-    url = organization.rstrip('/') + '/' + uri_quote(project) + '/_build/index?definitionId='\
-        + uri_quote(str(definition.id))
+    url = '{}/{}/_build/index?definitionId={}'.format(organization.rstrip('/'), uri_quote(project), definition.id)
     logger.debug('Opening web page: %s', url)
     open_new(url=url)
 
@@ -102,9 +109,16 @@ def fix_path_for_api(path):
 
 def get_definition_id_from_name(name, client, project, path=None):
     path = fix_path_for_api(path)
-    definition_references = client.get_definitions(project=project, name=name, path=path)
+    cache_key = (client.config.base_url.lower(), project, name, path)
+    cached_definition = _definition_id_cache.get(cache_key)
+    if cached_definition is not None and time.monotonic() - cached_definition[0] < _DEFINITION_ID_CACHE_TTL:
+        return cached_definition[1]
+    # Only need to tell a single match apart from multiple matches, so never fetch more than two.
+    definition_references = client.get_definitions(project=project, name=name, path=path, top=2)
     if len(definition_references) == 1:
-        return definition_references[0].id
+        definition_id = definition_references[0].id
+        _definition_id_cache[cache_key] = (time.monotonic(), definition_id)
+        return definition_id
     if len(definition_references) > 1:
         if is_uuid(project):
             project = definition_references[0].project.name
@@ -120,10 +134,42 @@ def _resolve_repository_as_id(repository, organization, project):
     if is_uuid(repository):
         return repository
 
+    # Misses are cached as well as hits.
+    cache_key = _get_repository_cache_key(repository, organization, project)
+    if cache_key not in _repository_id_cache:
+        _repository_id_cache[cache_key] = _get_repository_id_from_name(repository, organization, project)
+    return _repository_id_cache[cache_key]
+
+
+def _get_repository_id_from_name(repository, organization, project):
     git_client = get_git_client(organization)
+    # The repository route accepts a name in place of the id, so try a single lookup before listing them all.
+    try:
+        return git_client.get_repository(repository_id=repository, project=project).id
+    except AzureDevOpsServiceError as ex:
+        if ex.type_key != _GIT_REPOSITORY_NOT_FOUND_TYPE_KEY:
+            raise
+        logger.debug(ex, exc_info=True)
+    except AzureDevOpsClientRequestError as ex:
+        # Errors without a wrapped exception body (such as a bare 404) carry no type to check.
+        logger.debug(ex, exc_info=True)
+
     repositories = git_client.get_repositories(project=project, include_links=False, include_all_urls=False)
+    # Index the whole listing so later lookups in this project are served from the cache.
+    repository_ids = {}
     for found_repository in repositories:
-        if found_repository.name.lower() == repository.lower():
-            return found_repository.id
+        repository_ids[_get_repository_cache_key(found_repository.name, organization, project)] = found_repository.id
+    _repository_id_cache.update(repository_ids)
+    return repository_ids.get(_get_repository_cache_key(repository, organization, project))
+
+
+def _get_repository_cache_key(repository, organization, project):
+    # Repository names are case-insensitive.
+    return organization.lower(), project, repository.lower()
+
 
-    return None
+_DEFAULT_DEFINITION_LIST_TOP = 100
+_GIT_REPOSITORY_NOT_FOUND_TYPE_KEY = 'GitRepositoryNotFoundException'
+_DEFINITION_ID_CACHE_TTL = 60  # seconds
+_definition_id_cache = {}
+_repository_id_cache = {}
@@ -7,17 +7,15 @@ from webbrowser import open_new
 from knack.log import get_logger
 from knack.util import CLIError
 from azext_devops.dev.common.services import (get_build_client,
-                                              get_git_client,
                                               resolve_instance_and_project,
                                               get_new_pipeline_client_v60)
 from azext_devops.dev.common.uri import uri_quote
-from azext_devops.dev.common.uuid import is_uuid
 from azext_devops.dev.common.git import resolve_git_ref_heads
 from azext_devops.devops_sdk.v5_0.build.models import Build, DefinitionReference
 from azext_devops.devops_sdk.v6_0.pipelines.models import (RunPipelineParameters,
                                                            RunResourcesParameters,
                                                            RepositoryResourceParameters)
-from .build_definition import get_definition_id_from_name, fix_path_for_api
+from .build_definition import get_definition_id_from_name, fix_path_for_api, _resolve_repository_as_id
 from .pipeline_run import _open_pipeline_run, _open_pipeline_run6_0
 
 logger = get_logger(__name__)
@@ -201,18 +199,6 @@ def _open_pipeline(definition, organization):
     """
     # https://dev.azure.com/OrgName/ProjectName/_build/index?definitionId=1234
     project = definition.project.name
-    url = organization.rstrip('/') + '/' + uri_quote(project) + '/_build?definitionId='\
-        + uri_quote(str(definition.id))
+    url = '{}/{}/_build?definitionId={}'.format(organization.rstrip('/'), uri_quote(project), definition.id)
     logger.debug('Opening web page: %s', url)
     open_new(url=url)
-
-
-def _resolve_repository_as_id(repository, organization, project):
-    if is_uuid(repository):
-        return repository
-    git_client = get_git_client(organization)
-    repositories = git_client.get_repositories(project=project, include_links=False, include_all_urls=False)
-    for found_repository in repositories:
-        if found_repository.name.lower() == repository.lower():
-            return found_repository.id
-    return None
@@ -199,7 +199,7 @@ def pipeline_update(id, description=None, new_name=None,  # pylint: disable=rede
 def validate_name_is_available(name, path, organization, project):
     client = get_new_pipeline_client(organization=organization)
     path = fix_path_for_api(path)
-    definition_references = client.get_definitions(project=project, name=name, path=path)
+    definition_references = client.get_definitions(project=project, name=name, path=path, top=1)
     if len(definition_references.value) == 0:
         return True
     return False
@@ -19,6 +19,12 @@ from .client_configuration import ClientConfiguration
 from . import _models
 from ._file_cache import OPTIONS_CACHE as OPTIONS_FILE_CACHE
 
+try:
+    # orjson is an optional, faster JSON decoder for large collection responses.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +113,13 @@ class Client(object):
         return response
 
     def _unwrap_collection(self, response):
+        if orjson is not None and response.content:
+            try:
+                wrapper = self._base_deserialize.deserialize_data(orjson.loads(response.content),
+                                                                  'VssJsonCollectionWrapper')
+                return wrapper.value
+            except ValueError as ex:
+                logger.debug(ex, exc_info=True)
         if response.headers.get("transfer-encoding") == 'chunked':
             wrapper = self._base_deserialize.deserialize_data(response.json(), 'VssJsonCollectionWrapper')
         else:
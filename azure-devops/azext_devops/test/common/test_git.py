@@ -0,0 +1,89 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import subprocess
+import unittest
+
+try:
+    # Attempt to load mock (works on Python 3.3 and above)
+    from unittest.mock import patch
+except ImportError:
+    # Attempt to load mock (works on Python version below 3.3)
+    from mock import patch
+
+from azext_devops.dev.common.git import get_git_remotes, _git_remotes
+
+
+class TestGitMethods(unittest.TestCase):
+
+    _TEST_REMOTES_OUTPUT = (b'origin\thttps://dev.azure.com/org/project/_git/repo (fetch)\n'
+                            b'origin\thttps://dev.azure.com/org/project/_git/repo (push)\n')
+
+    def setUp(self):
+        self.check_output_patcher = patch('azext_devops.dev.common.git.subprocess.check_output')
+        self.getcwd_patcher = patch('azext_devops.dev.common.git.os.getcwd')
+
+        #start the patchers
+        self.mock_check_output = self.check_output_patcher.start()
+        self.mock_getcwd = self.getcwd_patcher.start()
+
+        #clear git remotes cache before running each test
+        _git_remotes.clear()
+
+    def tearDown(self):
+        patch.stopall()
+        _git_remotes.clear()
+
+    def test_get_git_remotes_failure_is_cached_per_directory(self):
+        # set return values
+        self.mock_getcwd.return_value = '/not/a/repo'
+        self.mock_check_output.side_effect = subprocess.CalledProcessError(128, ['git', 'remote', '-v'])
+        first_response = get_git_remotes()
+        second_response = get_git_remotes()
+        #assert
+        self.assertIsNone(first_response)
+        self.assertIsNone(second_response)
+        self.mock_check_output.assert_called_once()
+
+    def test_get_git_remotes_reruns_detection_in_new_directory(self):
+        # set return values
+        self.mock_getcwd.return_value = '/not/a/repo'
+        self.mock_check_output.side_effect = subprocess.CalledProcessError(128, ['git', 'remote', '-v'])
+        get_git_remotes()
+        self.mock_getcwd.return_value = '/some/repo'
+        self.mock_check_output.side_effect = None
+        self.mock_check_output.return_value = self._TEST_REMOTES_OUTPUT
+        response = get_git_remotes()
+        #assert
+        self.assertEqual(self.mock_check_output.call_count, 2)
+        self.assertEqual(response, {'origin(fetch)': 'https://dev.azure.com/org/project/_git/repo',
+                                    'origin(push)': 'https://dev.azure.com/org/project/_git/repo'})
+
+    def test_get_git_remotes_only_returns_current_directory_remotes(self):
+        # set return values
+        self.mock_getcwd.return_value = '/first/repo'
+        self.mock_check_output.return_value = self._TEST_REMOTES_OUTPUT
+        first_response = get_git_remotes()
+        self.mock_getcwd.return_value = '/second/repo'
+        self.mock_check_output.return_value = b'upstream\thttps://dev.azure.com/org/other/_git/other (push)\n'
+        second_response = get_git_remotes()
+        #assert
+        self.assertEqual(first_response, {'origin(fetch)': 'https://dev.azure.com/org/project/_git/repo',
+                                          'origin(push)': 'https://dev.azure.com/org/project/_git/repo'})
+        self.assertEqual(second_response, {'upstream(push)': 'https://dev.azure.com/org/other/_git/other'})
+
+    def test_get_git_remotes_with_deleted_working_directory(self):
+        # set return values
+        self.mock_getcwd.side_effect = FileNotFoundError(2, 'No such file or directory')
+        self.mock_check_output.side_effect = subprocess.CalledProcessError(128, ['git', 'remote', '-v'])
+        response = get_git_remotes()
+        #assert
+        self.assertIsNone(response)
+        self.mock_check_output.assert_called_once()
+        self.assertEqual(_git_remotes, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
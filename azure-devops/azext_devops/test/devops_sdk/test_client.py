@@ -0,0 +1,61 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import unittest
+
+try:
+    # Attempt to load mock (works on Python 3.3 and above)
+    from unittest.mock import patch, MagicMock
+except ImportError:
+    # Attempt to load mock (works on Python version below 3.3)
+    from mock import patch, MagicMock
+
+from requests import Response
+from azext_devops.devops_sdk.client import Client
+
+
+class TestClientMethods(unittest.TestCase):
+
+    _TEST_DEVOPS_ORGANIZATION = 'https://someorganization.visualstudio.com'
+    _TEST_COLLECTION_CONTENT = b'{"count": 2, "value": [{"id": 1, "name": "first"}, {"id": 2, "name": "second"}]}'
+
+    def setUp(self):
+        self.client = Client(base_url=self._TEST_DEVOPS_ORGANIZATION)
+        self.response = Response()
+        self.response.status_code = 200
+        self.response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        self.response._content = self._TEST_COLLECTION_CONTENT  # pylint: disable=protected-access
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_unwrap_collection_without_orjson(self):
+        with patch('azext_devops.devops_sdk.client.orjson', None):
+            collection = self.client._unwrap_collection(self.response)
+        #assert
+        self.assertEqual(collection, json.loads(self._TEST_COLLECTION_CONTENT)['value'])
+
+    def test_unwrap_collection_with_orjson(self):
+        mock_orjson = MagicMock()
+        mock_orjson.loads.side_effect = json.loads
+        with patch('azext_devops.devops_sdk.client.orjson', mock_orjson):
+            collection = self.client._unwrap_collection(self.response)
+        #assert
+        mock_orjson.loads.assert_called_once_with(self._TEST_COLLECTION_CONTENT)
+        self.assertEqual(collection, json.loads(self._TEST_COLLECTION_CONTENT)['value'])
+
+    def test_unwrap_collection_falls_back_when_orjson_fails(self):
+        mock_orjson = MagicMock()
+        mock_orjson.loads.side_effect = ValueError('Integer exceeds 64-bit range')
+        with patch('azext_devops.devops_sdk.client.orjson', mock_orjson):
+            collection = self.client._unwrap_collection(self.response)
+        #assert
+        mock_orjson.loads.assert_called_once()
+        self.assertEqual(collection, json.loads(self._TEST_COLLECTION_CONTENT)['value'])
+
+
+if __name__ == '__main__':
+    unittest.main()
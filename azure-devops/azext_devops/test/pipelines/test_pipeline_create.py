@@ -0,0 +1,67 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+
+try:
+    # Attempt to load mock (works on Python 3.3 and above)
+    from unittest.mock import patch
+except ImportError:
+    # Attempt to load mock (works on Python version below 3.3)
+    from mock import patch
+
+from azext_devops.dev.pipelines.pipeline_create import validate_name_is_available
+from azext_devops.dev.common.services import clear_connection_cache
+from azext_devops.test.utils.authentication import AuthenticatedTests
+from azext_devops.devops_sdk.v5_1.build.build_client import BuildClient
+from azext_devops.devops_sdk.v5_1.build.models import BuildDefinitionReference
+
+
+class TestPipelineCreateMethods(AuthenticatedTests):
+
+    _TEST_DEVOPS_ORGANIZATION = 'https://someorganization.visualstudio.com'
+    _TEST_DEVOPS_PROJECT = 'testproject'
+
+    def setUp(self):
+        self.authentication_setup()
+        self.authenticate()
+        self.get_client = patch('azext_devops.devops_sdk.connection.Connection.get_client')
+        self.get_definitions_patcher = patch('azext_devops.devops_sdk.v5_1.build.build_client.BuildClient.get_definitions')
+
+        #start the patchers
+        self.mock_get_client = self.get_client.start()
+        self.mock_get_definitions = self.get_definitions_patcher.start()
+
+        # Set return values which will be same across tests
+        self.mock_get_client.return_value = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+
+        #clear connection cache before running each test
+        clear_connection_cache()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_validate_name_is_available(self):
+        # set return values
+        self.mock_get_definitions.return_value = BuildClient.GetDefinitionsResponseValue([], None)
+        response = validate_name_is_available('ContosoBuild', None, self._TEST_DEVOPS_ORGANIZATION,
+                                              self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertTrue(response)
+        self.mock_get_definitions.assert_called_once_with(project=self._TEST_DEVOPS_PROJECT, name='ContosoBuild',
+                                                          path=None, top=1)
+
+    def test_validate_name_is_not_available(self):
+        # set return values
+        self.mock_get_definitions.return_value = BuildClient.GetDefinitionsResponseValue(
+            [BuildDefinitionReference(id=42, name='ContosoBuild')], None)
+        response = validate_name_is_available('ContosoBuild', None, self._TEST_DEVOPS_ORGANIZATION,
+                                              self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertFalse(response)
+
+
+if __name__ == '__main__':
+    unittest.main()
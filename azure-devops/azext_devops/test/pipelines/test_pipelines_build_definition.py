@@ -0,0 +1,206 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+
+try:
+    # Attempt to load mock (works on Python 3.3 and above)
+    from unittest.mock import patch
+except ImportError:
+    # Attempt to load mock (works on Python version below 3.3)
+    from mock import patch
+
+from azext_devops.dev.pipelines.build_definition import (build_definition_list,
+                                                         get_definition_id_from_name,
+                                                         _definition_id_cache,
+                                                         _DEFAULT_DEFINITION_LIST_TOP,
+                                                         _DEFINITION_ID_CACHE_TTL,
+                                                         _repository_id_cache,
+                                                         _resolve_repository_as_id)
+from azext_devops.dev.common.services import clear_connection_cache
+from azext_devops.test.utils.authentication import AuthenticatedTests
+from azext_devops.devops_sdk._models import WrappedException
+from azext_devops.devops_sdk.exceptions import AzureDevOpsClientRequestError, AzureDevOpsServiceError
+from azext_devops.devops_sdk.v5_0.build.build_client import BuildClient
+from azext_devops.devops_sdk.v5_0.build.models import BuildDefinitionReference
+from azext_devops.devops_sdk.v5_0.git.git_client import GitClient
+from azext_devops.devops_sdk.v5_0.git.models import GitRepository
+
+
+class TestPipelinesBuildDefinitionMethods(AuthenticatedTests):
+
+    _TEST_DEVOPS_ORGANIZATION = 'https://someorganization.visualstudio.com'
+    _TEST_DEVOPS_PROJECT = 'testproject'
+    _TEST_REPOSITORY_ID = '2d7d4b6e-3b6f-4a36-9d05-8f2a3c9b1e4a'
+
+    def setUp(self):
+        self.authentication_setup()
+        self.authenticate()
+        self.get_client = patch('azext_devops.devops_sdk.connection.Connection.get_client')
+        self.get_repository_patcher = patch('azext_devops.devops_sdk.v5_0.git.git_client.GitClient.get_repository')
+        self.get_repositories_patcher = patch('azext_devops.devops_sdk.v5_0.git.git_client.GitClient.get_repositories')
+
+        #start the patchers
+        self.mock_get_client = self.get_client.start()
+        self.mock_get_repository = self.get_repository_patcher.start()
+        self.mock_get_repositories = self.get_repositories_patcher.start()
+
+        # Set return values which will be same across tests
+        self.mock_get_client.return_value = GitClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+
+        #clear connection, definition and repository caches before running each test
+        clear_connection_cache()
+        _definition_id_cache.clear()
+        _repository_id_cache.clear()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_resolve_repository_as_id_with_uuid(self):
+        response = _resolve_repository_as_id(self._TEST_REPOSITORY_ID, self._TEST_DEVOPS_ORGANIZATION,
+                                             self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertEqual(response, self._TEST_REPOSITORY_ID)
+        self.mock_get_repository.assert_not_called()
+        self.mock_get_repositories.assert_not_called()
+
+    def test_resolve_repository_as_id_with_name(self):
+        # set return values
+        self.mock_get_repository.return_value = GitRepository(id=self._TEST_REPOSITORY_ID, name='MyRepo')
+        response = _resolve_repository_as_id('MyRepo', self._TEST_DEVOPS_ORGANIZATION, self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertEqual(response, self._TEST_REPOSITORY_ID)
+        self.mock_get_repository.assert_called_once_with(repository_id='MyRepo', project=self._TEST_DEVOPS_PROJECT)
+        self.mock_get_repositories.assert_not_called()
+
+    def test_resolve_repository_as_id_falls_back_to_list(self):
+        # set return values
+        self.mock_get_repository.side_effect = AzureDevOpsServiceError(
+            WrappedException(message='TF401019: The Git repository with name or identifier myrepo does not exist.',
+                             type_key='GitRepositoryNotFoundException'))
+        self.mock_get_repositories.return_value = [GitRepository(id='other-id', name='OtherRepo'),
+                                                   GitRepository(id=self._TEST_REPOSITORY_ID, name='MyRepo')]
+        response = _resolve_repository_as_id('myrepo', self._TEST_DEVOPS_ORGANIZATION, self._TEST_DEVOPS_PROJECT)
+        other_response = _resolve_repository_as_id('OtherRepo', self._TEST_DEVOPS_ORGANIZATION,
+                                                   self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertEqual(response, self._TEST_REPOSITORY_ID)
+        self.assertEqual(other_response, 'other-id')
+        self.mock_get_repository.assert_called_once()
+        self.mock_get_repositories.assert_called_once()
+
+    def test_resolve_repository_as_id_falls_back_on_untyped_error(self):
+        # set return values
+        self.mock_get_repository.side_effect = AzureDevOpsClientRequestError('Operation returned a 404 status code.')
+        self.mock_get_repositories.return_value = [GitRepository(id=self._TEST_REPOSITORY_ID, name='MyRepo')]
+        response = _resolve_repository_as_id('MyRepo', self._TEST_DEVOPS_ORGANIZATION, self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertEqual(response, self._TEST_REPOSITORY_ID)
+        self.mock_get_repositories.assert_called_once()
+
+    def test_resolve_repository_as_id_raises_other_service_errors(self):
+        # set return values
+        self.mock_get_repository.side_effect = AzureDevOpsServiceError(
+            WrappedException(message='TF200016: The following project does not exist: testproject.',
+                             type_key='ProjectDoesNotExistWithNameException'))
+        with self.assertRaises(AzureDevOpsServiceError):
+            _resolve_repository_as_id('MyRepo', self._TEST_DEVOPS_ORGANIZATION, self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.mock_get_repositories.assert_not_called()
+
+    def test_resolve_repository_as_id_is_cached(self):
+        # set return values
+        self.mock_get_repository.return_value = GitRepository(id=self._TEST_REPOSITORY_ID, name='MyRepo')
+        _resolve_repository_as_id('MyRepo', self._TEST_DEVOPS_ORGANIZATION, self._TEST_DEVOPS_PROJECT)
+        response = _resolve_repository_as_id('myrepo', self._TEST_DEVOPS_ORGANIZATION, self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertEqual(response, self._TEST_REPOSITORY_ID)
+        self.mock_get_repository.assert_called_once()
+
+    def test_get_definition_id_from_name(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            # set return values
+            mock_get_definitions.return_value = [BuildDefinitionReference(id=42, name='MyDefinition')]
+            client = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+            response = get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+            #assert
+            self.assertEqual(response, 42)
+            mock_get_definitions.assert_called_once_with(project=self._TEST_DEVOPS_PROJECT, name='MyDefinition',
+                                                         path=None, top=2)
+
+    def test_get_definition_id_from_name_is_cached(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            # set return values
+            mock_get_definitions.return_value = [BuildDefinitionReference(id=42, name='MyDefinition')]
+            client = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+            get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+            response = get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+            #assert
+            self.assertEqual(response, 42)
+            mock_get_definitions.assert_called_once()
+
+    def test_get_definition_id_from_name_cache_expires(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            with patch('azext_devops.dev.pipelines.build_definition.time.monotonic') as mock_monotonic:
+                # set return values
+                mock_get_definitions.return_value = [BuildDefinitionReference(id=42, name='MyDefinition')]
+                client = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+                mock_monotonic.return_value = 1000
+                get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+                mock_monotonic.return_value = 1000 + _DEFINITION_ID_CACHE_TTL - 1
+                get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+                #assert
+                self.assertEqual(mock_get_definitions.call_count, 1)
+                mock_monotonic.return_value = 1000 + _DEFINITION_ID_CACHE_TTL
+                response = get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+                #assert
+                self.assertEqual(response, 42)
+                self.assertEqual(mock_get_definitions.call_count, 2)
+
+    def test_get_definition_id_from_name_multiple_matches(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            # set return values
+            mock_get_definitions.return_value = [BuildDefinitionReference(id=42, name='MyDefinition'),
+                                                 BuildDefinitionReference(id=43, name='MyDefinition')]
+            client = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+            with self.assertRaises(ValueError):
+                get_definition_id_from_name('MyDefinition', client, self._TEST_DEVOPS_PROJECT)
+
+    def test_list_definitions_applies_default_top(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            self.mock_get_client.return_value = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+            build_definition_list(organization=self._TEST_DEVOPS_ORGANIZATION, project=self._TEST_DEVOPS_PROJECT,
+                                  detect=None)
+            #assert
+            mock_get_definitions.assert_called_once_with(project=self._TEST_DEVOPS_PROJECT, name=None,
+                                                         repository_id=None, repository_type=None, top=100,
+                                                         query_order='DefinitionNameAscending')
+
+    def test_list_definitions_warns_when_default_top_reached(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            with patch('azext_devops.dev.pipelines.build_definition.logger.warning') as mock_warning:
+                # set return values
+                self.mock_get_client.return_value = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+                mock_get_definitions.return_value = [BuildDefinitionReference(id=i)
+                                                     for i in range(_DEFAULT_DEFINITION_LIST_TOP)]
+                build_definition_list(organization=self._TEST_DEVOPS_ORGANIZATION, project=self._TEST_DEVOPS_PROJECT,
+                                      detect=None)
+                #assert
+                mock_warning.assert_called_once()
+
+    def test_list_definitions_does_not_warn_with_explicit_top(self):
+        with patch('azext_devops.devops_sdk.v5_0.build.build_client.BuildClient.get_definitions') as mock_get_definitions:
+            with patch('azext_devops.dev.pipelines.build_definition.logger.warning') as mock_warning:
+                # set return values
+                self.mock_get_client.return_value = BuildClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+                mock_get_definitions.return_value = [BuildDefinitionReference(id=i) for i in range(5)]
+                build_definition_list(top=5, organization=self._TEST_DEVOPS_ORGANIZATION,
+                                      project=self._TEST_DEVOPS_PROJECT, detect=None)
+                #assert
+                mock_warning.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+
+try:
+    # Attempt to load mock (works on Python 3.3 and above)
+    from unittest.mock import patch
+except ImportError:
+    # Attempt to load mock (works on Python version below 3.3)
+    from mock import patch
+
+from azext_devops.dev.pipelines.release_definition import get_definition_id_from_name
+from azext_devops.devops_sdk.v5_0.release.release_client import ReleaseClient
+from azext_devops.devops_sdk.v5_0.release.models import ReleaseDefinition
+
+
+class TestReleaseDefinitionMethods(unittest.TestCase):
+
+    _TEST_DEVOPS_ORGANIZATION = 'https://someorganization.visualstudio.com'
+    _TEST_DEVOPS_PROJECT = 'testproject'
+
+    def setUp(self):
+        self.get_release_definitions_patcher = patch(
+            'azext_devops.devops_sdk.v5_0.release.release_client.ReleaseClient.get_release_definitions')
+
+        #start the patchers
+        self.mock_get_release_definitions = self.get_release_definitions_patcher.start()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_get_definition_id_from_name(self):
+        # set return values
+        self.mock_get_release_definitions.return_value = [ReleaseDefinition(id=7, name='MyRelease')]
+        client = ReleaseClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+        response = get_definition_id_from_name('MyRelease', client, self._TEST_DEVOPS_PROJECT)
+        #assert
+        self.assertEqual(response, 7)
+        self.mock_get_release_definitions.assert_called_once_with(project=self._TEST_DEVOPS_PROJECT,
+                                                                  search_text='MyRelease',
+                                                                  is_exact_name_match='true', top=2)
+
+    def test_get_definition_id_from_name_multiple_matches(self):
+        # set return values
+        self.mock_get_release_definitions.return_value = [ReleaseDefinition(id=7, name='MyRelease'),
+                                                          ReleaseDefinition(id=8, name='MyRelease')]
+        client = ReleaseClient(base_url=self._TEST_DEVOPS_ORGANIZATION)
+        with self.assertRaises(ValueError):
+            get_definition_id_from_name('MyRelease', client, self._TEST_DEVOPS_PROJECT)
+
+
+if __name__ == '__main__':
+    unittest.main()